@@ -6,7 +6,7 @@ from typing import List, Optional
 from loguru import logger
 import json
 import asyncio
-from openai import OpenAI
+from openai_client import get_async_client
 import os
 from .lx_music_controller import LXMusicController
 from search_tool.search_with_retry import search
@@ -122,8 +122,8 @@ class MusicAgent:
 
 
         try:
-            client = OpenAI()
-            response =  client.chat.completions.create(
+            client = get_async_client()
+            response = await client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=messages,
                 tools=tools,
@@ -155,7 +155,7 @@ class MusicAgent:
                         logger.error(f"Error in tool call {name}: {str(e)}")
                         raise
                     
-                response = client.chat.completions.create(
+                response = await client.chat.completions.create(
                     model="gpt-4o-mini",
                     messages=messages,
                     tools=tools,
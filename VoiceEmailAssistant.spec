@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('.env', '.')],
-    hiddenimports=['PyQt6', 'qasync', 'keyboard', 'sounddevice', 'numpy', 'openai', 'anthropic', 'torch', 'torchaudio', 'librosa', 'websockets'],
+    hiddenimports=['PyQt6', 'qasync', 'sounddevice', 'numpy', 'openai', 'anthropic', 'torch', 'torchaudio', 'librosa', 'websockets'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -1,7 +1,7 @@
 """
 Audio recording service implementation using sounddevice and PyAudio.
 """
-from typing import Callable, Optional, Generator
+from typing import Callable, Optional, Generator, List
 import numpy as np
 import sounddevice as sd
 from loguru import logger
@@ -10,6 +10,8 @@ import wave
 from datetime import datetime
 import scipy.signal
 import asyncio
+import math
+from collections import deque
 
 MAX_QUEUE_SIZE = 50  # 根据硬件性能调整
 
@@ -19,6 +21,12 @@ class AudioProcessor:
         self.source_sample_rate = 48000
         # 预计算重采样比例
         self.resample_ratio = self.target_sample_rate / self.source_sample_rate
+        # 预先设计多相滤波器，与 resample_poly 默认的 kaiser 滤波器一致，避免每个音频块重新设计
+        divisor = math.gcd(self.target_sample_rate, self.source_sample_rate)
+        self._up = self.target_sample_rate // divisor
+        self._down = self.source_sample_rate // divisor
+        max_rate = max(self._up, self._down)
+        self._filter = scipy.signal.firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=('kaiser', 5.0))
         
     def process_audio_chunk(self, audio_data):
         # 转换二进制音频数据为 Int16 数组
@@ -31,19 +39,21 @@ class AudioProcessor:
         # 使用更高效的重采样方法
         resampled_data = scipy.signal.resample_poly(
             pcm_data, 
-            self.target_sample_rate, 
-            self.source_sample_rate,
+            self._up, 
+            self._down,
+            window=self._filter,
             padtype='line'  # 使用线性填充
         )
         
-        # 直接转换为int16并返回字节
-        return resampled_data.astype(np.int16).tobytes()
+        # 限幅后转换为int16并返回字节，避免溢出回绕
+        return np.clip(resampled_data, -32768, 32767).astype(np.int16).tobytes()
 
 class AudioRecordingService:
     """
     Service for handling audio recording with real-time volume level detection.
     """
-    def __init__(self, sample_rate: int = 48000, channels: int = 1, target_sample_rate: int = 24000):
+    def __init__(self, sample_rate: int = 48000, channels: int = 1, target_sample_rate: int = 24000,
+                 max_buffer_seconds: Optional[float] = None):
         """
         Initialize the audio recording service.
         
@@ -51,12 +61,19 @@ class AudioRecordingService:
             sample_rate: The sample rate for recording (default: 48000 Hz)
             channels: Number of audio channels (default: 1 for mono)
             target_sample_rate: Target sample rate for processed audio (default: 24000 Hz)
+            max_buffer_seconds: Keep at most this many seconds of recorded audio, dropping
+                the oldest chunks first (default: None, unbounded)
         """
         self.sample_rate = sample_rate
         self.target_sample_rate = target_sample_rate
         self.channels = channels
         self.recording = False
-        self.audio_data = []
+        self.audio_data = deque()
+        # 录音缓冲上限（字节，int16），超过时丢弃最早的音频块
+        self.max_buffer_bytes = (
+            int(max_buffer_seconds * target_sample_rate * channels * 2) if max_buffer_seconds else None
+        )
+        self._buffered_bytes = 0
         self._volume_callback: Optional[Callable[[float], None]] = None
         self._initialized = False
         self.stream = None
@@ -111,7 +128,7 @@ class AudioRecordingService:
     def cleanup(self) -> None:
         """Clean up resources and stop recording if active."""
         try:
-            self.audio_data = []
+            self._clear_audio_data()
             if self.recording:
                 self.stop_recording()
 
@@ -138,7 +155,7 @@ class AudioRecordingService:
             return
 
         try:
-            self.audio_data = []  # 清空之前的录音数据
+            self._clear_audio_data()  # 清空之前的录音数据
             self._volume_callback = volume_callback
             
             # 创建音频流时增加dtype参数
@@ -159,6 +176,11 @@ class AudioRecordingService:
             logger.error(f"Failed to start recording: {e}")
             raise
 
+    def _clear_audio_data(self) -> None:
+        """清空录音缓冲"""
+        self.audio_data = deque()
+        self._buffered_bytes = 0
+
     def _process_audio_data(self, audio_data: np.ndarray) -> np.ndarray:
         """优化的音频处理流程"""
         # 直接处理 int16 数据，避免不必要的转换
@@ -181,6 +203,11 @@ class AudioRecordingService:
             # 直接处理音频数据
             processed_audio = self.audio_processor.process_audio_chunk(indata.tobytes())
             self.audio_data.append(processed_audio)
+            self._buffered_bytes += len(processed_audio)
+            # FIFO 裁剪：超过上限时丢弃最早的音频
+            if self.max_buffer_bytes is not None:
+                while self._buffered_bytes > self.max_buffer_bytes and len(self.audio_data) > 1:
+                    self._buffered_bytes -= len(self.audio_data.popleft())
 
             async def process_and_queue():
                 async with self._processing_lock:
@@ -237,7 +264,7 @@ class AudioRecordingService:
         except Exception as e:
             logger.error(f"Error stopping recording: {e}")
             self.recording = False
-            self.audio_data = []  # 确保在发生错误时也清空数据
+            self._clear_audio_data()  # 确保在发生错误时也清空数据
             raise
 
     async def get_audio_chunk(self) -> Optional[bytes]:
@@ -250,6 +277,10 @@ class AudioRecordingService:
         except asyncio.QueueEmpty:
             return None
 
+    def drain_pending(self) -> List[bytes]:
+        """一次性取出队列中剩余的音频块，不等待、不让出事件循环"""
+        return list(self._get_all_chunks())
+
     @property
     def is_recording(self) -> bool:
         """Check if recording is in progress."""
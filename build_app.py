@@ -19,7 +19,6 @@ def build_app():
         '--add-data=.env;.',  # 添加环境配置文件
         '--hidden-import=PyQt6',
         '--hidden-import=qasync',
-        '--hidden-import=keyboard',
         '--hidden-import=sounddevice',
         '--hidden-import=numpy',
         '--hidden-import=openai',
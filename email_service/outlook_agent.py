@@ -9,13 +9,23 @@ from pydantic import BaseModel, EmailStr, Field
 from email_service.outlook_service import OutlookService
 import json
 import asyncio
-from prompt import PROMPTS
-from openai import OpenAI
+from prompt import PROMPTS, PROMPT_CACHE_USER
+from openai_client import get_async_client
 import os
 
+# Shared Outlook service, so Outlook.Application is dispatched once instead of per command
+_outlook_service: Optional[OutlookService] = None
+
+def get_outlook_service() -> OutlookService:
+    """Return the shared Outlook service, creating it on first use."""
+    global _outlook_service
+    if _outlook_service is None:
+        _outlook_service = OutlookService()
+    return _outlook_service
+
 async def run_outlook_agent(user_input: str) -> str:
     """Run the outlook agent to create a draft email for user."""
-    outlook_service = OutlookService()
+    outlook_service = get_outlook_service()
     tools = [
         {
             "type": "function",
@@ -43,12 +53,13 @@ async def run_outlook_agent(user_input: str) -> str:
     ]
 
     try:
-        client = OpenAI()
-        response = client.chat.completions.create(
+        client = get_async_client()
+        response = await client.chat.completions.create(
             model="gpt-4o",
             messages=messages,
             tools=tools,
-            tool_choice="required"
+            tool_choice="required",
+            user=PROMPT_CACHE_USER
         )
 
         message = response.choices[0].message
@@ -76,11 +87,12 @@ async def run_outlook_agent(user_input: str) -> str:
                     logger.error(f"Error in tool call {name}: {str(e)}")
                     raise
                 
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4o",
                 messages=messages,
                 tools=tools,
-                tool_choice="auto"
+                tool_choice="auto",
+                user=PROMPT_CACHE_USER
             )
 
             message = response.choices[0].message
@@ -125,6 +137,9 @@ async def call_function(name: str, args: Union[str, dict], outlook_service: Outl
     except Exception as e:
         return f"Error: Function {name} failed - {str(e)}"
 
-async def cleanup(outlook_service: OutlookService):
-    """Cleanup Outlook service resources."""
-    await outlook_service.cleanup() 
\ No newline at end of file
+async def cleanup():
+    """Cleanup the shared Outlook service resources, call once on shutdown."""
+    global _outlook_service
+    if _outlook_service is not None:
+        await _outlook_service.cleanup()
+        _outlook_service = None 
\ No newline at end of file
@@ -24,6 +24,11 @@ class OutlookService:
     async def initialize(self):
         """Initialize Outlook connection, starting Outlook if needed"""
         try:
+            # Initialize COM once for the event loop thread, paired with CoUninitialize in cleanup()
+            if self._thread_id is None:
+                pythoncom.CoInitialize()
+                self._thread_id = threading.get_ident()
+
             # Check if already initialized
             if self.outlook is not None and self.namespace is not None:
                 logger.debug("Outlook already initialized")
@@ -100,8 +105,9 @@ class OutlookService:
                     mail_item.Importance = 2
                 
                 if attachments:
+                    existing = self._existing_attachments(attachments)
                     for attachment in attachments:
-                        if os.path.exists(attachment):
+                        if attachment in existing:
                             logger.debug(f"Adding attachment: {attachment}")
                             mail_item.Attachments.Add(attachment)
                         else:
@@ -121,6 +127,37 @@ class OutlookService:
                 logger.error(f"Failed to create email draft: {str(e)}", exc_info=True)
                 raise ValueError(f"Draft creation failed: {str(e)}")
             
+    @staticmethod
+    def _existing_attachments(attachments: list) -> set:
+        """
+        Return the subset of attachment paths that exist on disk.
+
+        Paths are grouped by parent directory; a directory holding two or more
+        attachments is listed once with os.scandir, a single attachment is checked
+        with one os.path.exists so large folders are not listed needlessly.
+        """
+        by_dir = {}
+        for attachment in attachments:
+            directory, name = os.path.split(os.path.abspath(attachment))
+            by_dir.setdefault(directory, []).append((attachment, name))
+
+        existing = set()
+        for directory, entries in by_dir.items():
+            if len(entries) == 1:
+                attachment, _ = entries[0]
+                if os.path.exists(attachment):
+                    existing.add(attachment)
+                continue
+            try:
+                with os.scandir(directory) as it:
+                    names = {os.path.normcase(e.name) for e in it}
+            except OSError:
+                continue
+            for attachment, name in entries:
+                if os.path.normcase(name) in names:
+                    existing.add(attachment)
+        return existing
+
     async def _display_mail_item(self, mail_item):
         """Display the mail item in a non-blocking way."""
         try:
@@ -33,6 +33,20 @@ class WhisperSpeechProvider:
             lambda: whisper.load_model(self.model_size)
         )
         logger.success(f"Loaded Whisper {self.model_size} model")
+        await self.warmup()
+
+    async def warmup(self):
+        """用 1 秒静音跑一次推理，提前完成首次推理的延迟初始化；失败不影响模型使用"""
+        try:
+            loop = asyncio.get_running_loop()
+            silence = np.zeros(self.sample_rate, dtype=np.float32)
+            await loop.run_in_executor(
+                self.executor,
+                lambda: self.model.transcribe(silence, language=self.language, fp16=False)
+            )
+            logger.debug("Whisper model warmed up")
+        except Exception as e:
+            logger.warning(f"Whisper warmup failed: {str(e)}")
 
     async def transcribe_audio(self, audio_data: np.ndarray, source_sample_rate: int) -> str:
         """
@@ -42,15 +56,12 @@ class WhisperSpeechProvider:
         :return: 识别文本
         """
         try:
-            # 预处理音频
-            processed_audio = self._preprocess_audio(audio_data, source_sample_rate)
-            
-            # 在线程池中运行识别
+            # 预处理（重采样）和识别都是 CPU 密集操作，一起放到线程池中运行，避免阻塞事件循环
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
                 self.executor,
                 lambda: self.model.transcribe(
-                    processed_audio,
+                    self._preprocess_audio(audio_data, source_sample_rate),
                     language=self.language,  # None enables auto-detection
                     fp16=False,
                     task="transcribe"  # Explicitly set transcription task
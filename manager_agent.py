@@ -6,8 +6,9 @@ from typing import List, Optional
 from loguru import logger
 import json
 import asyncio
-from prompt import PROMPTS
-from openai import OpenAI
+import io
+from prompt import PROMPTS, PROMPT_CACHE_USER
+from openai_client import get_async_client
 import os
 from email_service.outlook_agent import run_outlook_agent
 from LX_Music_agent.music_agent import MusicAgent
@@ -16,6 +17,51 @@ from readability_agent.readability_agent import run_readability_agent
 
 
 class ManagerAgent:
+    TOOLS = [
+        {
+            "type": "function",
+            "function": {
+                "name": "run_outlook_agent",
+                "description": "Invoke the outlook agent to create a draft email for user.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "user_input": {"type": "string", "description": "User input"},
+                    },
+                    "required": ["user_input"]
+                }
+            }
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "run_music_agent",
+                "description": "Invoke the music agent to pause, play, next track, previous track, search and play music.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "user_input": {"type": "string", "description": "User input for music control"}
+                    },
+                    "required": ["user_input"]
+                }
+            }
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "run_readability_agent",
+                "description": "Invoke the readability agent to improve the readability of the user input text.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "user_input": {"type": "string", "description": "User input"}
+                    },
+                    "required": ["user_input"]
+                }
+            }
+        }
+    ]
+
     def __init__(self):
         """Initialize the agent with OpenAI API key."""
         self.api_key = os.getenv("OPENAI_API_KEY")
@@ -24,53 +70,6 @@ class ManagerAgent:
 
     async def run(self, user_input: str) -> str:
         """Run the agent with user input and return response."""
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "run_outlook_agent",
-                    "description": "Invoke the outlook agent to create a draft email for user.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "user_input": {"type": "string", "description": "User input"},
-                        },
-                        "required": ["user_input"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "run_music_agent",
-                    "description": "Invoke the music agent to pause, play, next track, previous track, search and play music.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "user_input": {"type": "string", "description": "User input for music control"}
-                        },
-                        "required": ["user_input"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "run_readability_agent",
-                    "description": "Invoke the readability agent to improve the readability of the user input text.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "user_input": {"type": "string", "description": "User input"}
-                        },
-                        "required": ["user_input"]
-                    }
-                }
-            }
-        ]
-
-
-
         messages = [
             {"role": "system", "content": PROMPTS['allocate_task']},
             {"role": "user", "content": user_input}
@@ -78,12 +77,13 @@ class ManagerAgent:
 
 
         try:
-            client = OpenAI()
-            response =  client.chat.completions.create(
+            client = get_async_client()
+            response = await client.chat.completions.create(
                 model="gpt-4o",
                 messages=messages,
-                tools=tools,
-                tool_choice="required" # call one or more tools
+                tools=self.TOOLS,
+                tool_choice="required", # call one or more tools
+                user=PROMPT_CACHE_USER
             )
 
             message = response.choices[0].message
@@ -108,6 +108,107 @@ class ManagerAgent:
 
             raise RuntimeError(f"Agent execution failed: {str(e)}")
 
+    async def run_batch(self, transcripts: List[str], max_wait: float = 24 * 3600) -> List[Optional[str]]:
+        """Route queued transcripts offline through the OpenAI Batch API.
+
+        Only the allocate_task routing completion is batched (at the Batch API's
+        reduced price, completing asynchronously). The selected sub-agents are then
+        run live and in order, so their own completions, e.g. email drafting, are
+        billed normally and may open Outlook drafts or windows. The live voice path
+        keeps using run().
+
+        Args:
+            transcripts (List[str]): Transcripts to dispatch, one request each
+            max_wait (float): Maximum seconds to wait for the batch to finish
+
+        Returns:
+            List[Optional[str]]: Error message per transcript, None on success
+        """
+        if not transcripts:
+            return []
+
+        lines = []
+        for i, transcript in enumerate(transcripts):
+            lines.append(json.dumps({
+                "custom_id": f"transcript-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4o",
+                    "messages": [
+                        {"role": "system", "content": PROMPTS['allocate_task']},
+                        {"role": "user", "content": transcript}
+                    ],
+                    "tools": self.TOOLS,
+                    "tool_choice": "required",
+                    "user": PROMPT_CACHE_USER
+                }
+            }, ensure_ascii=False))
+
+        try:
+            client = get_async_client()
+            batch_file = await client.files.create(
+                file=("manager_batch.jsonl", io.BytesIO("\n".join(lines).encode("utf-8"))),
+                purpose="batch"
+            )
+            batch = await client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"Submitted batch {batch.id} with {len(transcripts)} transcripts")
+
+            # Poll with exponential backoff until the batch reaches a final state
+            delay = 5.0
+            waited = 0.0
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if waited >= max_wait:
+                    raise TimeoutError(f"Batch {batch.id} did not finish within {max_wait} seconds")
+                await asyncio.sleep(delay)
+                waited += delay
+                delay = min(delay * 2, 300.0)
+                batch = await client.batches.retrieve(batch.id)
+                logger.debug(f"Batch {batch.id} status: {batch.status}")
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+            output = await client.files.content(batch.output_file_id)
+            responses = {}
+            for line in output.text.splitlines():
+                if line.strip():
+                    result = json.loads(line)
+                    responses[result["custom_id"]] = result
+
+        except Exception as e:
+            logger.error(f"Error in batch execution: {str(e)}")
+            raise RuntimeError(f"Batch execution failed: {str(e)}")
+
+        # Demultiplex results back to their transcripts and dispatch the tool calls
+        errors: List[Optional[str]] = []
+        for i in range(len(transcripts)):
+            result = responses.get(f"transcript-{i}")
+            if result is None or result.get("error") or result["response"]["status_code"] != 200:
+                error = (result or {}).get("error") or "missing response"
+                logger.error(f"Batch request transcript-{i} failed: {error}")
+                errors.append(str(error))
+                continue
+
+            message = result["response"]["body"]["choices"][0]["message"]
+            tool_errors = []
+            for tool_call in message.get("tool_calls") or []:
+                name = tool_call["function"]["name"]
+                args = tool_call["function"]["arguments"]
+                logger.info(f"Calling tool {name} with arguments: {args}")
+                tool_result = await self.call_function(name, args)
+                logger.info(f"Tool {name} returned: {tool_result}")
+                # call_function reports failures as "Error: ..." strings instead of raising
+                if isinstance(tool_result, str) and tool_result.startswith("Error:"):
+                    tool_errors.append(tool_result)
+            errors.append("; ".join(tool_errors) if tool_errors else None)
+
+        return errors
+
     async def call_function(self, name, args):
         """Call a function by name with the given arguments.
         
@@ -0,0 +1,15 @@
+"""
+Shared OpenAI client for the chat completion agents.
+"""
+
+from functools import lru_cache
+from openai import AsyncOpenAI
+
+
+@lru_cache(maxsize=None)
+def get_async_client() -> AsyncOpenAI:
+    """Return a shared client so the HTTP connection pool is reused across calls.
+
+    Created lazily because OPENAI_API_KEY is only loaded from .env after import.
+    """
+    return AsyncOpenAI()
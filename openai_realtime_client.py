@@ -2,7 +2,7 @@ import os
 import json
 from loguru import logger
 import websockets
-from typing import Optional, Dict, Callable, Any
+from typing import Optional, Dict, Callable, Any, Union
 import base64
 import asyncio
 from dotenv import load_dotenv
@@ -66,13 +66,13 @@ class OpenAIRealtimeAudioTextClient:
             content = data.get("text", "") or data.get("content", "") or data.get(event_type, "")
             
             is_final = data.get("final", False)
-            logger.debug(f"Received {event_type}: {content} (final: {is_final})")
+            logger.debug("Received {}: {} (final: {})", event_type, content, is_final)
             if data.get("type") == "response.text.done":
                 await self.response_done_handler()
             elif data.get("type") == "response.text.delta":
                 self.concatenated_text_buffer += content
             elif data.get("type") == "response.text.done":
-                logger.debug(f"Concatenated text buffer: {self.concatenated_text_buffer}")
+                logger.debug("Concatenated text buffer: {}", self.concatenated_text_buffer)
 
         return handler
 
@@ -113,7 +113,7 @@ class OpenAIRealtimeAudioTextClient:
 
     def _on_close(self, ws, close_status_code, close_msg):
         """Handle WebSocket connection closing"""
-        logger.debug(f"WebSocket connection closed: {close_status_code} - {close_msg}")
+        logger.debug("WebSocket connection closed: {} - {}", close_status_code, close_msg)
 
     async def _on_open(self):
         """Handle connection opening"""
@@ -150,16 +150,27 @@ class OpenAIRealtimeAudioTextClient:
 
     async def _receive_messages(self):
         """Async message receiver"""
+        ws = self.ws
         try:
-            async for message in self.ws:
+            async for message in ws:
                 await self._on_message(message)
         except websockets.exceptions.ConnectionClosed:
             logger.debug("WebSocket connection closed")
         except Exception as e:
             logger.error(f"Error receiving messages: {e}")
-
-    async def send_audio(self, audio_data: bytes):
-        """Async audio sending"""
+        finally:
+            # 服务器关闭连接（如会话过期）后清除引用，下次使用前会重新连接
+            if self.ws is ws:
+                self.ws = None
+                self.session_id = None
+
+    @property
+    def is_connected(self) -> bool:
+        """WebSocket 已建立且接收任务仍在运行"""
+        return self.ws is not None and self.receive_task is not None and not self.receive_task.done()
+
+    async def send_audio(self, audio_data: Union[bytes, memoryview]):
+        """Async audio sending, accepts any bytes-like object without copying it first"""
         try:
             if not self.ws:
                 logger.warning("WebSocket not available, attempting to reconnect...")
@@ -221,7 +232,7 @@ class OpenAIRealtimeAudioTextClient:
                         "instructions": instructions
                     }
                 }))
-                logger.debug(f"Started response with instructions: {instructions}")
+                logger.debug("Started response with instructions: {}", instructions)
             else:
                 raise RuntimeError("Failed to establish WebSocket connection")
         except Exception as e:
@@ -266,16 +277,22 @@ class OpenAIRealtimeAudioTextClient:
         """Handle text delta events"""
         content = data.get("delta", "")
         #self.concatenated_text_buffer += content
-        logger.debug(f"Received text delta: {content}")
+        logger.debug("Received text delta: {}", content)
 
 
     async def _handle_text_done(self, data: dict):
         """Handle text done events"""
         content = data.get("text", "")
         self.concatenated_text_buffer += content
-        logger.debug(f"Received text done: {content}")
+        logger.debug("Received text done: {}", content)
         await self.response_done_handler()
 
+    def reset_response_state(self):
+        """Clear the response buffer and flags, keeping the connection open"""
+        self.response_event.clear()
+        self.response_finished = False
+        self.concatenated_text_buffer = ""
+
     def cleanup(self):
         """Cleanup resources"""
         try:
@@ -285,13 +302,7 @@ class OpenAIRealtimeAudioTextClient:
             if self.receive_task and not self.receive_task.done():
                 self.receive_task.cancel()
                 
-            # Clear event and reset flags
-            if hasattr(self, 'response_event'):
-                self.response_event.clear()
-            self.response_finished = False
-            
-            # Clear buffers and reset state
-            self.concatenated_text_buffer = ""
+            self.reset_response_state()
             self.session_id = None
             
             logger.debug("OpenAI client cleanup completed")
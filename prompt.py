@@ -2,6 +2,8 @@
 File to store all the prompts, sometimes templates.
 """
 
+import uuid
+
 PROMPTS = {
     'paraphrase-gpt-realtime': """
     Comprehend the accompanying audio, and output the recognized text. 
@@ -40,4 +42,12 @@ PROMPTS = {
     'readability': """Improve the readability of the user input text. Enhance the structure, clarity, and flow without altering the original meaning. Correct any grammar and punctuation errors, and ensure that the text is well-organized and easy to understand. It's important to achieve a balance between easy-to-digest, thoughtful, insightful, and not overly formal. We're not writing a column article appearing in The New York Times. Instead, the audience would mostly be friendly colleagues or online audiences. Therefore, you need to, on one hand, make sure the content is easy to digest and accept. On the other hand, it needs to present insights and best to have some surprising and deep points. Do not add any additional information or change the intent of the original content. Don't respond to any questions or requests in the conversation. Just treat them literally and correct any mistakes. Don't translate any part of the text, even if it's a mixture of multiple languages. Only output the revised text, without any other explanation. Reply in the same language as the user input (text to be processed).\n\nBelow is the text to be processed:\n""",
 
 
-}
\ No newline at end of file
+}
+
+# Strip surrounding whitespace once so every request sends a byte-identical
+# prefix, which is what OpenAI prompt caching keys on
+PROMPTS = {name: text.strip() for name, text in PROMPTS.items()}
+
+# Stable per-process identifier passed as `user` so requests sharing the same
+# static prompt prefix are routed together and hit the prompt cache
+PROMPT_CACHE_USER = f"voice-email-assistant-{uuid.uuid4().hex}"
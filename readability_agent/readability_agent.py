@@ -1,11 +1,14 @@
 from typing import List, Optional, Union
 from loguru import logger
 import json
+import orjson
 import asyncio
-from prompt import PROMPTS
-from openai import OpenAI
+from prompt import PROMPTS, PROMPT_CACHE_USER
+from openai_client import get_async_client
 from display_window.display_window import display_content
 
+MODEL = "gpt-4o"
+
 async def run_readability_agent(user_input: str) -> str:
     """Run the agent with user input and return response."""
     tools = [
@@ -26,32 +29,38 @@ async def run_readability_agent(user_input: str) -> str:
     ]
 
     messages = [
-        {"role": "user", "content": PROMPTS['readability'] + user_input}
+        {"role": "system", "content": PROMPTS['readability']},
+        {"role": "user", "content": user_input}
     ]
 
     try:
-        client = OpenAI()
-        response = client.chat.completions.create(
-            model="gpt-4o",
+        response = await get_async_client().chat.completions.create(
+            model=MODEL,
             messages=messages,
             tools=tools,
-            tool_choice="required"  # call one or more tools
+            tool_choice="required",  # call one or more tools
+            user=PROMPT_CACHE_USER
         )
 
         message = response.choices[0].message
+        tool_calls = [
+            (tool_call.function.name, tool_call.function.arguments)
+            for tool_call in message.tool_calls or []
+        ]
+
+        if tool_calls:
+            async def _invoke(name, args):
+                logger.info(f"Calling tool {name} with arguments: {args}")
+                return await call_function(name, args)
 
-        if message.tool_calls:
-            for tool_call in message.tool_calls:
-                try:
-                    name = tool_call.function.name
-                    args = tool_call.function.arguments
-                    logger.info(f"Calling tool {name} with arguments: {args}")
-                    tool_result = await call_function(name, args)
-                    logger.info(f"Tool {name} returned: {tool_result}")
+            # Tool calls are independent, run them concurrently; call_function reports
+            # failures as error strings, so results are logged rather than raised
+            results = await asyncio.gather(
+                *[_invoke(name, args) for name, args in tool_calls]
+            )
 
-                except Exception as e:
-                    logger.error(f"Error in tool call {name}: {str(e)}")
-                    raise
+            for (name, _), tool_result in zip(tool_calls, results):
+                logger.info(f"Tool {name} returned: {tool_result}")
 
         return None
 
@@ -72,8 +81,8 @@ async def call_function(name: str, args: Union[str, dict]):
     # Parse JSON string if args is a string
     if isinstance(args, str):
         try:
-            args = json.loads(args)
-        except json.JSONDecodeError:
+            args = orjson.loads(args)
+        except (orjson.JSONDecodeError, json.JSONDecodeError):
             return f"Error: Invalid JSON arguments - {args}"
     
     try:
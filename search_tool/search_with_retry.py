@@ -1,8 +1,69 @@
 import argparse
+import atexit
 import sys
+import threading
 import time
+from collections import OrderedDict
 from duckduckgo_search import DDGS
 from loguru import logger
+
+_ddgs = None
+
+# Search results cache: bounded in size and age, (query, max_results) -> (timestamp, results)
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = 600  # seconds
+_search_cache = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _get_ddgs():
+    """Return a shared DDGS session so repeated searches reuse its connection."""
+    global _ddgs
+    if _ddgs is None:
+        _ddgs = DDGS()
+    return _ddgs
+
+
+def close_ddgs():
+    """Close the shared DDGS session."""
+    global _ddgs
+    if _ddgs is not None:
+        try:
+            _ddgs.__exit__(None, None, None)
+        except Exception as e:
+            logger.warning("Failed to close DDGS session: {}", e)
+        _ddgs = None
+
+
+atexit.register(close_ddgs)
+
+
+def _cached_search(query, max_results):
+    """Run a DuckDuckGo text search, caching results per (query, max_results).
+
+    Entries expire after SEARCH_CACHE_TTL seconds. Failed searches raise and empty
+    results (DDG returns these when rate limiting) are not cached.
+    """
+    key = (query, max_results)
+    now = time.monotonic()
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is not None:
+            if now - entry[0] < SEARCH_CACHE_TTL:
+                _search_cache.move_to_end(key)
+                return entry[1]
+            del _search_cache[key]
+
+    results = tuple(_get_ddgs().text(query, max_results=max_results))
+    if results:
+        with _search_cache_lock:
+            _search_cache[key] = (now, results)
+            _search_cache.move_to_end(key)
+            if len(_search_cache) > SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+    return results
+
+
 def search_with_retry(query, max_results=10, max_retries=3):
     """
     Search using DuckDuckGo and return results with URLs and text snippets.
@@ -14,37 +75,36 @@ def search_with_retry(query, max_results=10, max_retries=3):
     """
     for attempt in range(max_retries):
         try:
-            print(f"DEBUG: Searching for query: {query} (attempt {attempt + 1}/{max_retries})", 
-                  file=sys.stderr)
+            logger.debug("Searching for query: {} (attempt {}/{})", query, attempt + 1, max_retries)
             
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=max_results))
+            results = list(_cached_search(query, max_results))
                 
             if not results:
-                print("DEBUG: No results found", file=sys.stderr)
+                logger.debug("No results found")
                 return []
             
-            print(f"DEBUG: Found {len(results)} results", file=sys.stderr)
+            logger.debug("Found {} results", len(results))
             return results
                 
         except Exception as e:
-            print(f"ERROR: Attempt {attempt + 1}/{max_retries} failed: {str(e)}", file=sys.stderr)
+            logger.error("Attempt {}/{} failed: {}", attempt + 1, max_retries, e)
             if attempt < max_retries - 1:  # If not the last attempt
-                print(f"DEBUG: Waiting 1 second before retry...", file=sys.stderr)
+                logger.debug("Waiting 1 second before retry...")
                 time.sleep(1)  # Wait 1 second before retry
             else:
-                print(f"ERROR: All {max_retries} attempts failed", file=sys.stderr)
+                logger.error("All {} attempts failed", max_retries)
                 raise
 
 def format_results(results):
     """Format and print search results."""
-    final_results = ""
-    for i, r in enumerate(results, 1):
-        final_results += f"\n=== Result {i} ===\n"
-        final_results += f"URL: {r.get('href', 'N/A')}\n"
-        final_results += f"Title: {r.get('title', 'N/A')}\n"
-        final_results += f"Snippet: {r.get('body', 'N/A')}\n"
-        final_results += f"-----------------------------------\n"
+    final_results = "".join(
+        f"\n=== Result {i} ===\n"
+        f"URL: {r.get('href', 'N/A')}\n"
+        f"Title: {r.get('title', 'N/A')}\n"
+        f"Snippet: {r.get('body', 'N/A')}\n"
+        f"-----------------------------------\n"
+        for i, r in enumerate(results, 1)
+    )
     #logger.info(f"Final results: {final_results}")
     return final_results
 
@@ -64,5 +124,5 @@ def search(query, max_results=10, max_retries=3):
             return format_results(results)
             
     except Exception as e:
-        print(f"ERROR: Search failed: {str(e)}", file=sys.stderr)
+        logger.error("Search failed: {}", e)
         sys.exit(1)
\ No newline at end of file
@@ -5,23 +5,47 @@ from audio_service.audio_service import AudioRecordingService
 from openai_realtime_client import OpenAIRealtimeAudioTextClient
 from prompt import PROMPTS
 from manager_agent import ManagerAgent
+from email_service.outlook_agent import cleanup as cleanup_outlook
+
+# input_audio_buffer.append 单条消息上限为 15 MiB（base64 后），原始音频按 10 MiB 分块
+MAX_APPEND_BYTES = 10 * 1024 * 1024
+# 空闲时检查 WebSocket 连接并在断开时重连的间隔（秒）；心跳由 websockets 自带的 ping 完成
+KEEPALIVE_INTERVAL = 20
 
 
 class VoiceEmailWorkflow:
-    def __init__(self):
+    __slots__ = (
+        'transcript', 'audio_service', 'is_processing', 'is_shutting_down',
+        'openai_client', '_current_audio_data', '_stream_task',
+        '_connect_lock', '_keepalive_task', '_reconnect_task',
+    )
+
+    def __init__(self, max_buffer_seconds: Optional[float] = None):
         self.transcript = ""	
-        self.audio_service = AudioRecordingService()
+        self.audio_service = AudioRecordingService(max_buffer_seconds=max_buffer_seconds)
         self.is_processing = False
         self.is_shutting_down = False
         self.openai_client = OpenAIRealtimeAudioTextClient()
         self._current_audio_data = None  # 存储当前音频数据
+        self._connect_lock = asyncio.Lock()  # 防止并发重复建立连接
+        self._keepalive_task = None
+        self._reconnect_task = None
         logger.debug("VoiceEmailWorkflow initialized")
 
     async def initialize_services(self):
         """初始化所有服务"""
         try:
-            # 初始化音频服务
-            if not self.audio_service.initialize():
+            # 无论首次连接是否成功都启动保活任务，离线启动后联网也能自动建立预连接
+            if self._keepalive_task is None or self._keepalive_task.done():
+                self._keepalive_task = asyncio.create_task(self._keepalive())
+
+            # 音频设备初始化（同步调用，放到线程中）与 OpenAI 预连接互不依赖，并发执行；
+            # 预连接失败不影响启动，由保活任务重试
+            audio_ok, _ = await asyncio.gather(
+                asyncio.to_thread(self.audio_service.initialize),
+                self._preconnect()
+            )
+            if not audio_ok:
                 logger.error("Audio service initialization returned False")
                 raise RuntimeError("Audio service initialization failed")
 
@@ -31,6 +55,41 @@ class VoiceEmailWorkflow:
             logger.error(f"Service initialization failed: {str(e)}")
             raise
 
+    async def _ensure_connected(self):
+        """仅在没有可用连接时建立 WebSocket 连接"""
+        async with self._connect_lock:
+            if not self.openai_client.is_connected:
+                # 残留的已关闭连接先释放
+                await self.openai_client.disconnect()
+                await self.openai_client.connect()
+
+    async def _preconnect(self):
+        """后台为下一次录音建立新会话，失败时由保活任务重试"""
+        try:
+            await self._ensure_connected()
+        except Exception as e:
+            logger.warning(f"Pre-connect failed: {str(e)}")
+
+    async def _keepalive(self):
+        """空闲时定期检查连接，断开（或从未连上）时重新预连接"""
+        try:
+            while not self.is_shutting_down:
+                await asyncio.sleep(KEEPALIVE_INTERVAL)
+                if self.is_processing or self.openai_client.is_connected:
+                    continue
+                try:
+                    await self._ensure_connected()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"WebSocket reconnect failed: {str(e)}")
+                    try:
+                        await self.openai_client.disconnect()
+                    except Exception as e:
+                        logger.warning(f"WebSocket disconnect failed: {str(e)}")
+        except asyncio.CancelledError:
+            logger.debug("WebSocket keepalive stopped")
+
     async def start_recording(self, volume_callback: Optional[Callable[[float], None]] = None):
         if self.is_processing or self.is_shutting_down:
             logger.warning("Workflow already in progress")
@@ -39,7 +98,7 @@ class VoiceEmailWorkflow:
         self.is_processing = True
         try:
 
-            await self.openai_client.connect()
+            await self._ensure_connected()
 
             self.audio_service.start_recording(volume_callback)
 
@@ -86,7 +145,7 @@ class VoiceEmailWorkflow:
                     await asyncio.wait_for(self._stream_task, timeout=2.0)
                     logger.debug("Audio stream task cancelled successfully")
                 except (asyncio.CancelledError, asyncio.TimeoutError):
-                    logger.warning("Audio streaming task cancelled or timed out", exc_info=True)
+                    logger.warning("Audio streaming task cancelled or timed out")
             
             # 使用 await 调用 run_in_executor
             logger.debug("Stopping audio recording...")
@@ -95,25 +154,22 @@ class VoiceEmailWorkflow:
                 None, 
                 self.audio_service.stop_recording
             )
-            logger.debug(f"Got full audio of length: {len(full_audio)}")
+            logger.debug("Got full audio of length: {}", len(full_audio))
             
             if len(full_audio) == 0:
                 logger.error("No audio data recorded")
                 raise ValueError("No audio data recorded")
             
-            # 保存音频数据以供重试使用
-            self._current_audio_data = full_audio.tobytes()
+            # 保存音频数据以供重试使用，使用可变的 bytearray 原地追加
+            # 直接从 numpy 缓冲区复制，避免 tobytes() 额外复制一份
+            self._current_audio_data = bytearray(memoryview(full_audio).cast('B'))
             
             # 新增：清空剩余音频缓存
             logger.debug("Draining remaining audio chunks...")
-            chunks_drained = 0
-            while True:
-                chunk = await self.audio_service.get_audio_chunk()
-                if not chunk:
-                    break
-                chunks_drained += 1
-                self._current_audio_data += chunk  # 追加到存储的音频数据
-            logger.debug(f"Drained {chunks_drained} remaining chunks")
+            remaining = self.audio_service.drain_pending()
+            for chunk in remaining:
+                self._current_audio_data.extend(chunk)  # 追加到存储的音频数据
+            logger.debug("Drained {} remaining chunks", len(remaining))
             
             # 检查 WebSocket 连接状态
             if not self.openai_client.ws:
@@ -124,23 +180,24 @@ class VoiceEmailWorkflow:
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    logger.debug(f"Processing attempt {attempt + 1}/{max_retries}")
+                    logger.debug("Processing attempt {}/{}", attempt + 1, max_retries)
                     
                     # 确保每次重试都有新的连接
-                    if not self.openai_client.ws:
+                    if not self.openai_client.is_connected:
                         logger.debug("Reconnecting to OpenAI...")
-                        await self.openai_client.connect()
+                        await self._ensure_connected()
                         logger.debug("Reconnected successfully")
                     
                     # 重新发送完整的音频数据
                     if self._current_audio_data:
-                        logger.debug(f"Sending audio data of length: {len(self._current_audio_data)}")
-                        # 分块发送音频数据，每块32KB
-                        chunk_size = 32 * 1024
-                        for i in range(0, len(self._current_audio_data), chunk_size):
-                            chunk = self._current_audio_data[i:i + chunk_size]
+                        # 先清空录音期间实时追加到服务器的音频，只转录本地受上限约束的副本
+                        await self.openai_client.clear_audio_buffer()
+                        logger.debug("Sending audio data of length: {}", len(self._current_audio_data))
+                        # 按单条消息上限分块发送，通常一次即可发完，无需人为延迟
+                        audio_view = memoryview(self._current_audio_data)
+                        for i in range(0, len(audio_view), MAX_APPEND_BYTES):
+                            chunk = audio_view[i:i + MAX_APPEND_BYTES]
                             await self.openai_client.send_audio(chunk)
-                            await asyncio.sleep(0.01)  # 小延迟，避免发送太快
                     
                     logger.debug("WebSocket connected, committing audio...")
                     await self.openai_client.commit_audio()
@@ -179,11 +236,11 @@ class VoiceEmailWorkflow:
                     else:
                         raise RuntimeError("Response timeout after all retries")
                 except Exception as e:
-                    logger.error(f"Error during processing: {type(e)}: {str(e)}", exc_info=True)
+                    logger.error(f"Error during processing: {type(e).__name__}: {str(e)}")
                     raise
                 
         except Exception as e:
-            logger.error(f"Workflow failed with error type {type(e)}: {str(e)}", exc_info=True)
+            logger.error(f"Workflow failed with error type {type(e).__name__}: {str(e)}")
             raise
         finally:
             manager_agent = ManagerAgent()
@@ -195,32 +252,66 @@ class VoiceEmailWorkflow:
                     await asyncio.wait_for(disconnect_task, timeout=5.0)
                     logger.debug("Disconnected from OpenAI")
             except Exception as e:
-                logger.error(f"Error during disconnect: {str(e)}", exc_info=True)
+                logger.error(f"Error during disconnect: {str(e)}")
+            # 每次录音使用新会话，断开后立即为下一次录音预连接，无需等待保活任务
+            if not self.is_shutting_down:
+                self._reconnect_task = asyncio.create_task(self._preconnect())
             logger.debug("Transcript reset in stop_and_process")
 
-    async def cleanup(self):
-        """清理资源"""
+    async def reset_recording_state(self):
+        """轻量重置：清除本次录音的状态，保留已初始化的音频设备和 WebSocket 连接"""
+        try:
+            if self.audio_service.is_recording:
+                await asyncio.to_thread(self.audio_service.stop_recording)
+            self.openai_client.reset_response_state()
+
+            self.transcript = ""
+            self.is_processing = False
+            self._current_audio_data = None
+            if hasattr(self, '_stream_task'):
+                delattr(self, '_stream_task')
+            logger.debug("Recording state reset")
+        except Exception as e:
+            logger.error(f"Reset recording state failed: {str(e)}")
+
+    async def full_cleanup(self):
+        """完全清理资源，仅在退出时调用"""
         try:
             logger.debug("Starting cleanup process...")
+            self.is_shutting_down = True
             
-            # First cleanup OpenAI client
-            if hasattr(self, 'openai_client'):
+            for task in (self._keepalive_task, self._reconnect_task):
+                if task:
+                    task.cancel()
+            self._keepalive_task = None
+            self._reconnect_task = None
+
+            async def cleanup_openai():
                 logger.debug("Cleaning up OpenAI client...")
-                try:
-                    if self.openai_client.ws:
-                        await self.openai_client.disconnect()
-                    self.openai_client.cleanup()
-                except Exception as e:
-                    logger.error(f"OpenAI cleanup error: {str(e)}")
-            
-            # Finally cleanup audio service
-            if hasattr(self, 'audio_service'):
+                if self.openai_client.ws:
+                    await self.openai_client.disconnect()
+                self.openai_client.cleanup()
+
+            def cleanup_audio():
                 logger.debug("Cleaning up audio service...")
-                try:
-                    # Audio service cleanup is synchronous
-                    self.audio_service.cleanup()
-                except Exception as e:
-                    logger.error(f"Audio service cleanup error: {str(e)}")
+                # Audio service cleanup is synchronous
+                self.audio_service.cleanup()
+
+            # 两个服务之间没有依赖，并发清理
+            results = await asyncio.gather(
+                cleanup_openai(),
+                asyncio.to_thread(cleanup_audio),
+                return_exceptions=True
+            )
+            for name, result in zip(("OpenAI", "Audio service"), results):
+                if isinstance(result, Exception):
+                    logger.error(f"{name} cleanup error: {str(result)}")
+
+            # Outlook COM 在事件循环线程上初始化，必须在同一线程释放
+            try:
+                await cleanup_outlook()
+            except Exception as e:
+                logger.error(f"Outlook cleanup error: {str(e)}")
 
             # Reset internal state
             self.transcript = ""
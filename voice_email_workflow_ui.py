@@ -1,29 +1,133 @@
 import sys
+import os
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                            QPushButton, QTextEdit, QProgressBar, QLabel,
+                            QPushButton, QPlainTextEdit, QProgressBar, QLabel,
                             QSystemTrayIcon, QMenu, QStyle)
-from PyQt6.QtCore import Qt, QTimer, QMetaObject, Q_ARG, pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, QMetaObject, QPoint, pyqtSlot, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap
 import asyncio
-from qasync import QEventLoop, asyncSlot
+from qasync import QEventLoop
 from voice_email_workflow import VoiceEmailWorkflow
 from loguru import logger
-import keyboard  # 新增导入
-import random
+import ctypes
+from ctypes import wintypes
+import threading
+import time
+from collections import deque
+
+
+# Win32 热键常量
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_NOREPEAT = 0x4000
+WM_HOTKEY = 0x0312
+WM_QUIT = 0x0012
+
+# 错误日志文件，记录带完整堆栈的异常；放在用户数据目录，避免依赖当前工作目录是否可写
+ERROR_LOG_FILE = os.path.join(
+    os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), 'VoiceEmailAssistant', 'errors.log'
+)
+
+
+class HotkeyListener(threading.Thread):
+    """通过 Win32 RegisterHotKey 注册全局热键，在独立线程中接收 WM_HOTKEY。
+
+    由系统过滤按键，只有热键真正按下时才会执行 Python 代码；回调在本线程中
+    调用，需要自行转交到 Qt / asyncio 线程。
+    """
+
+    def __init__(self, hotkeys):
+        """
+        Args:
+            hotkeys: {热键ID: (修饰键, 虚拟键码, 回调)}
+        """
+        super().__init__(name="HotkeyListener", daemon=True)
+        self._hotkeys = hotkeys
+        self._thread_id = None
+
+    def run(self):
+        user32 = ctypes.windll.user32
+        # RegisterHotKey(None, ...) 绑定到调用线程的消息队列，必须在本线程注册
+        self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+        for hotkey_id, (modifiers, vk, _) in self._hotkeys.items():
+            if not user32.RegisterHotKey(None, hotkey_id, modifiers | MOD_NOREPEAT, vk):
+                logger.error(f"Failed to register hotkey {hotkey_id}")
+
+        msg = wintypes.MSG()
+        try:
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == WM_HOTKEY and msg.wParam in self._hotkeys:
+                    try:
+                        self._hotkeys[msg.wParam][2]()
+                    except Exception as e:
+                        logger.error(f"Hotkey callback failed: {str(e)}")
+        finally:
+            for hotkey_id in self._hotkeys:
+                user32.UnregisterHotKey(None, hotkey_id)
+
+    def stop(self):
+        """结束消息循环并注销热键"""
+        if self._thread_id:
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
 
 
 class VoiceEmailUI(QMainWindow):
+    # 音量更新信号，音频线程发出，GUI 线程排队处理
+    volume_changed = pyqtSignal(int)
+    # 日志缓冲区由空变为非空时发出，GUI 线程排队启动一次刷新
+    log_pending = pyqtSignal()
+    VOLUME_MAX_RATE = 30  # 音量条最高刷新频率 (Hz)
+    MAX_RECORDING_SECONDS = 60  # 录音缓冲上限，超出部分丢弃最早的音频
+    RECORDING_WARNING_SECONDS = 45  # 录音时长提醒
+    LOG_FLUSH_INTERVAL_MS = 50  # 日志批量刷新到界面的间隔
+    LOG_MAX_LINES = 1000  # 日志窗口保留的最大行数
+
+    # 录音按钮样式：按 recording 属性切换，录音中为方形停止按钮，否则为圆形录音按钮
+    _RECORD_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #FF4444;
+            border: none;
+        }
+        QPushButton[recording="true"] {
+            border-radius: 10px;
+        }
+        QPushButton[recording="false"] {
+            border-radius: 40px;
+        }
+        QPushButton:hover {
+            background-color: #FF6666;
+        }
+        QPushButton:pressed {
+            background-color: #CC3333;
+        }
+    """
+
     def __init__(self):
         super().__init__()
         logger.debug("Initializing VoiceEmailUI")
-        self.workflow = VoiceEmailWorkflow()
+        self.workflow = VoiceEmailWorkflow(max_buffer_seconds=self.MAX_RECORDING_SECONDS)
         self.recording = False
         self.dragging = False
         self.offset = None
+        self._process_task = None
+        self._cmd_queue = asyncio.Queue()
+        self._cmd_task = None
+        self._recording_warning_timer = QTimer(self)
+        self._recording_warning_timer.setSingleShot(True)
+        self._recording_warning_timer.setInterval(self.RECORDING_WARNING_SECONDS * 1000)
+        self._recording_warning_timer.timeout.connect(self._warn_recording_length)
+        self._pending_pos = None
+        self._move_scheduled = False
+        self._last_volume = None
+        self._last_volume_emit = 0.0
+        self._current_style_state = None
+        self.volume_changed.connect(self._set_volume_level, Qt.ConnectionType.QueuedConnection)
         self.initUI()
         self.setupTrayIcon()
-        # Set window flags to remove from taskbar and make it tool window
-        self.setWindowFlags(Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint)
+        # Set window flags once: tool window (not in taskbar), frameless and always on top
+        self.setWindowFlags(
+            Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint
+        )
         self.update_button_style()  # Initialize button style
         self.setup_logger()
         logger.debug("VoiceEmailUI initialization completed")
@@ -41,6 +145,8 @@ class VoiceEmailUI(QMainWindow):
         # Record button - using custom style
         self.record_button = QPushButton()
         self.record_button.setFixedSize(80, 80)
+        self.record_button.setProperty("recording", False)
+        self.record_button.setStyleSheet(self._RECORD_BUTTON_STYLE)
         self.record_button.clicked.connect(self.toggle_recording)
         layout.addWidget(self.record_button, alignment=Qt.AlignmentFlag.AlignCenter)
         
@@ -86,102 +192,116 @@ class VoiceEmailUI(QMainWindow):
         
         layout.addLayout(bottom_layout)
         
-        # Create separate log window
+        # 日志窗口在第一次展开时才创建，之前的日志先缓存在 _pending_log_lines
+        self.log_window = None
+        self.log_display = None
+        self._pending_log_lines = deque(maxlen=self.LOG_MAX_LINES)
+
+    def _create_log_window(self):
+        """Create the separate log window and replay the buffered log lines"""
         self.log_window = QWidget(None)
         self.log_window.setWindowFlags(Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint)
         log_layout = QVBoxLayout(self.log_window)
         
         # Log display area - increased size and font
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setUndoRedoEnabled(False)
+        self.log_display.setMaximumBlockCount(self.LOG_MAX_LINES)  # 只保留最近的日志，旧日志自动丢弃
         self.log_display.setMinimumHeight(600)  # 增加高度
         self.log_display.setMinimumWidth(800)   # 增加宽度
         self.log_display.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #F0F0F0;
                 border: 1px solid #CCCCCC;
                 border-radius: 4px;
                 padding: 8px;
                 font-family: Consolas, Monaco, monospace;
                 font-size: 20pt;  /* 增大字体 */
-                line-height: 1.8;
             }
         """)
         log_layout.addWidget(self.log_display)
-        self.log_window.hide()  # Initially hidden
-        
-        # Initialize timer for UI updates
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_ui)
-        self.timer.start(100)
+        if self._pending_log_lines:
+            self.log_display.appendPlainText("\n".join(self._pending_log_lines))
+            self._pending_log_lines.clear()
 
     def update_button_style(self):
-        """更新按钮样式"""
-        if self.recording:
-            # 停止按钮样式 - 方形
-            self.record_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #FF4444;
-                    border-radius: 10px;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background-color: #FF6666;
-                }
-                QPushButton:pressed {
-                    background-color: #CC3333;
-                }
-            """)
-        else:
-            # 开始录音按钮样式 - 圆形
-            self.record_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #FF4444;
-                    border-radius: 40px;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background-color: #FF6666;
-                }
-                QPushButton:pressed {
-                    background-color: #CC3333;
-                }
-            """)
-
-    def update_ui(self):
-        """Update UI display"""
-        if random.random() < 0.001:  # Only log 0.1% of the updates
-            loop = asyncio.get_event_loop()
-            status_msg = f"Event loop status: running={loop.is_running()}, closed={loop.is_closed()}"
-            logger.debug(status_msg)
-            self.add_log_message(status_msg)
+        """更新按钮样式，状态未变化时跳过"""
+        if self._current_style_state == self.recording:
+            return
+        self._current_style_state = self.recording
+        # 只切换属性并重新 polish，无需重新解析样式表
+        self.record_button.setProperty("recording", self.recording)
+        self.record_button.style().unpolish(self.record_button)
+        self.record_button.style().polish(self.record_button)
 
     def setup_logger(self):
         """设置 loguru 日志处理器"""
+        # sink 可能在任意线程被调用，只把消息放入缓冲区，由 GUI 线程的定时器批量刷新
+        self._log_buffer = deque()
+        self._log_lock = threading.Lock()
+
         def ui_sink(message):
-            # 确保在主线程中更新 UI
-            record = message.record
-            log_message = f"[{record['level'].name}] {record['message']}"
-            QMetaObject.invokeMethod(self, "add_log_message",
-                                   Qt.ConnectionType.QueuedConnection,
-                                   Q_ARG(str, log_message))
-        
-        # 添加自定义 sink 到 loguru
-        logger.add(ui_sink, format="{message}", level="DEBUG")
+            # message 已由 loguru 按 format 渲染好，去掉结尾换行即可
+            log_message = str(message).rstrip()
+            with self._log_lock:
+                was_empty = not self._log_buffer
+                self._log_buffer.append(log_message)
+            if was_empty:
+                self.log_pending.emit()
+
+        # 单次定时器只在有新日志时启动，空闲时没有周期性唤醒
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_logs)
+        self.log_pending.connect(self._flush_timer.start, Qt.ConnectionType.QueuedConnection)
+
+        # 界面只显示 INFO 及以上，调试信息留给控制台/文件 sink
+        # 添加自定义 sink 到 loguru；sink 只做入队，直接在调用线程执行，不需要 loguru 的队列线程
+        # format 使用函数形式，loguru 不会在界面消息后追加异常堆栈
+        logger.add(ui_sink, format=lambda _: "[{level.name}] {message}\n", level="INFO", enqueue=False)
+        # 完整的异常堆栈只写入错误日志文件，界面只显示异常类型和消息
+        # delay=True 在第一条错误出现时才创建文件，文件不可写也不会影响启动
+        try:
+            os.makedirs(os.path.dirname(ERROR_LOG_FILE), exist_ok=True)
+            logger.add(ERROR_LOG_FILE, level="ERROR", backtrace=True, diagnose=False, enqueue=True,
+                       delay=True, rotation="5 MB", retention=3)
+        except Exception as e:
+            logger.warning(f"Error log file disabled: {str(e)}")
+
+    def _flush_logs(self):
+        """把缓冲的日志一次性追加到显示区域"""
+        with self._log_lock:
+            if not self._log_buffer:
+                return
+            pending, self._log_buffer = self._log_buffer, deque()
+        self.add_log_message("\n".join(pending))
 
     @pyqtSlot(str)
     def add_log_message(self, message: str):
         """添加日志消息到显示区域"""
-        self.log_display.append(message)
-        # 滚动到底部
-        self.log_display.verticalScrollBar().setValue(
-            self.log_display.verticalScrollBar().maximum()
-        )
+        if self.log_display is None:
+            # 日志窗口尚未创建，先缓存
+            self._pending_log_lines.extend(message.split("\n"))
+            return
+        # 光标在末尾时 appendPlainText 会自动滚动到底部
+        self.log_display.appendPlainText(message)
 
     def volume_callback(self, level: float):
-        """音量回调，更新进度条"""
+        """音量回调（音频线程），节流后通过信号更新进度条"""
         # 将音量级别转换为0-100的范围
         volume_level = min(100, int(level * 100))
+        now = time.monotonic()
+        # 数值未变化或刷新过快时丢弃，减少进度条重绘
+        if volume_level == self._last_volume or now - self._last_volume_emit < 1 / self.VOLUME_MAX_RATE:
+            return
+        self._last_volume = volume_level
+        self._last_volume_emit = now
+        self.volume_changed.emit(volume_level)
+
+    def _set_volume_level(self, volume_level: int):
+        """在 GUI 线程中更新进度条"""
         self.volume_bar.setValue(volume_level)
     
     def closeEvent(self, event=None):
@@ -191,7 +311,7 @@ class VoiceEmailUI(QMainWindow):
                 event.ignore()
             
             # Hide log window if visible
-            if self.log_window.isVisible():
+            if self.log_window is not None and self.log_window.isVisible():
                 self.log_window.hide()
                 self.toggle_log_button.setText("▶")
             
@@ -218,60 +338,104 @@ class VoiceEmailUI(QMainWindow):
             if self.recording:
                 self.recording = False
                 self.update_button_style()
-                # Cancel any ongoing recording tasks
+                # Cancel any ongoing recording tasks and wait briefly so it stops sending
+                # before the audio service is stopped
                 if hasattr(self.workflow, '_stream_task'):
-                    self.workflow._stream_task.cancel()
-                # Stop the audio service
-                self.workflow.audio_service.stop_recording()
-                # Cleanup all services
-                await self.workflow.cleanup()
-            logger.debug("Cleanup completed successfully")
+                    task = self.workflow._stream_task
+                    task.cancel()
+                    # asyncio.wait 不会抛出任务自身的异常，确保下面的重置一定执行
+                    await asyncio.wait({task}, timeout=1.0)
+                    if task.done() and not task.cancelled() and task.exception():
+                        logger.warning(f"Audio stream task failed: {str(task.exception())}")
+                # Stop the audio service and reset per-recording state, keeping services loaded
+                await self.workflow.reset_recording_state()
+            logger.trace("Cleanup completed successfully")
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
             raise
 
-    @asyncSlot()
-    async def toggle_recording(self):
+    @pyqtSlot()
+    def toggle_recording(self):
+        """Queue a toggle command for the command worker"""
+        self._cmd_queue.put_nowait("toggle")
+
+    async def _command_worker(self):
+        """Long-lived consumer that runs UI commands one at a time"""
+        while True:
+            cmd = await self._cmd_queue.get()
+            try:
+                if cmd == "toggle":
+                    await self._toggle_recording()
+            except Exception as e:
+                logger.error(f"Command {cmd} failed: {str(e)}")
+            finally:
+                self._cmd_queue.task_done()
+
+    async def _toggle_recording(self):
         """Toggle recording state"""
         try:
             if not self.recording:
-                logger.debug("Starting recording process...")
+                if self._process_task and not self._process_task.done():
+                    self.add_log_message("上一段录音仍在处理中，请稍候")
+                    return
+                logger.trace("Starting recording process...")
                 self.add_log_message("开始录音...")
-                # Ensure clean state before starting
-                await self.workflow.initialize_services()
-                
                 self.recording = True
                 self.update_button_style()
                 await self.workflow.start_recording(volume_callback=self.volume_callback)
+                self._recording_warning_timer.start()
                 self.add_log_message("录音已开始")
-                logger.debug("Recording started successfully")
+                logger.trace("Recording started successfully")
             else:
-                logger.debug("Stopping recording process...")
+                logger.trace("Stopping recording process...")
                 self.add_log_message("停止录音...")
                 self.recording = False
+                self._recording_warning_timer.stop()
                 self.update_button_style()
-                try:
-                    await asyncio.wait_for(
-                        self.workflow.stop_and_process(),
-                        timeout=35.0
-                    )
-                    self.add_log_message("录音处理完成")
-                    logger.debug("stop_and_process completed successfully")
-                except (asyncio.CancelledError, TimeoutError, ValueError, Exception) as e:
-                    error_msg = f"处理失败: {str(e)}"
-                    self.add_log_message(error_msg)
-                    logger.error(error_msg, exc_info=True)
-                finally:
-                    logger.debug("cleaning up...")
-                    await self.workflow.cleanup()
-                    self.add_log_message("清理完成")
+                self.hide()
+                # 转录在后台进行，界面立即回到空闲状态
+                self._process_task = asyncio.create_task(self._process_recording())
         except Exception as e:
-            error_msg = f"录音操作失败: {str(e)}"
+            error_msg = f"录音操作失败: {type(e).__name__}: {e}"
             self.add_log_message(error_msg)
-            logger.error(error_msg, exc_info=True)
+            logger.opt(exception=e).error(error_msg)
             self.recording = False
             self.update_button_style()
 
+    def _warn_recording_length(self):
+        """录音时间过长时提醒用户"""
+        if self.recording:
+            warning = f"已录音 {self.RECORDING_WARNING_SECONDS} 秒，超过 {self.MAX_RECORDING_SECONDS} 秒的部分将丢弃最早的音频"
+            self.add_log_message(warning)
+            # 日志窗口默认隐藏，用托盘通知确保录音时能看到提醒
+            self.tray_icon.showMessage("语音邮件助手", warning, QSystemTrayIcon.MessageIcon.Warning, 5000)
+
+    async def _process_recording(self):
+        """后台停止录音并处理转录结果"""
+        try:
+            await asyncio.wait_for(
+                self.workflow.stop_and_process(),
+                timeout=35.0
+            )
+            self.add_log_message("录音处理完成")
+            logger.debug("stop_and_process completed successfully")
+        except asyncio.CancelledError:
+            # 取消需要继续向上传播，清理仍在 finally 中完成
+            raise
+        except (asyncio.TimeoutError, ValueError) as e:
+            # 超时或没有录到音频属于预期内的失败，不需要堆栈
+            error_msg = f"处理失败: {type(e).__name__}: {e}"
+            self.add_log_message(error_msg)
+            logger.error(error_msg)
+        except Exception as e:
+            error_msg = f"处理失败: {type(e).__name__}: {e}"
+            self.add_log_message(error_msg)
+            logger.opt(exception=e).error(error_msg)
+        finally:
+            logger.debug("cleaning up...")
+            await self.workflow.reset_recording_state()
+            self.add_log_message("清理完成")
+
     def handle_transcript(self, text: str):
         """处理转录文本，创建Outlook草稿"""
         try:
@@ -285,34 +449,32 @@ class VoiceEmailUI(QMainWindow):
         except Exception as e:
             logger.error(f"创建邮件草稿失败: {str(e)}")
 
+    @pyqtSlot()
     def show_window(self):
         """确保窗口正确显示的方法"""
-        logger.debug("Showing window...")
+        logger.trace("Showing window...")
         self.update_button_style()
-        QTimer.singleShot(100, self._do_show)
+        self._do_show()
         # If log window was visible, show it again
-        if self.toggle_log_button.text() == "隐藏日志 ▲":
+        if self.log_window is not None and self.toggle_log_button.text() == "隐藏日志 ▲":
             self.log_window.show()
             self.log_window.raise_()
     
     def _do_show(self):
         """实际执行显示窗口的操作"""
-        # Set window to stay on top
-        self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
         self.show()
-        logger.debug("Window shown, forcing repaint...")
-        self.repaint()
-        logger.debug("Window repainted")
-        # 确保所有子部件都更新
-        for widget in self.findChildren(QWidget):
-            widget.repaint()
+        # 请求一次合并的异步重绘，子部件随顶层窗口一起更新
+        self.update()
         self.raise_()  # Brings window to front
         self.activateWindow()  # Activates the window
         self.setFocus()  # Gives focus to the window
-        logger.debug("Window activated and brought to front")
+        logger.trace("Window activated and brought to front")
 
     async def initialize(self):
         """异步初始化所有服务"""
+        # 启动命令处理协程，录音开关命令按顺序串行执行
+        if self._cmd_task is None:
+            self._cmd_task = asyncio.create_task(self._command_worker())
         try:
             await self.workflow.initialize_services()
             logger.info("All services initialized successfully")
@@ -328,6 +490,20 @@ class VoiceEmailUI(QMainWindow):
         except Exception as e:
             logger.error(f"Error stopping recording: {str(e)}")
 
+    async def cancel_background_tasks(self):
+        """退出前取消后台任务，避免在服务清理后仍在使用 WebSocket 和音频服务"""
+        # 先停止命令处理协程，不再接受新的录音命令，再取消正在进行的处理
+        for task in (self._cmd_task, self._process_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await asyncio.wait_for(task, timeout=5.0)
+                except (asyncio.CancelledError, asyncio.TimeoutError):
+                    pass
+                except Exception as e:
+                    logger.error(f"Background task failed during shutdown: {str(e)}")
+        self._cmd_task = None
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self.dragging = True
@@ -336,13 +512,27 @@ class VoiceEmailUI(QMainWindow):
 
     def mouseMoveEvent(self, event):
         if self.dragging and self.offset:
-            new_pos = event.globalPosition().toPoint() - self.offset
-            self.move(new_pos)
-            # Move log window with main window if it's visible
-            if self.log_window.isVisible():
-                self.log_window.move(self.x() + self.width(), self.y())
+            # Only remember the latest position, the move itself is coalesced per event loop pass
+            self._pending_pos = event.globalPosition().toPoint() - self.offset
+            if not self._move_scheduled:
+                self._move_scheduled = True
+                QTimer.singleShot(0, self._flush_move)
         super().mouseMoveEvent(event)
 
+    def _flush_move(self):
+        """Apply the latest pending drag position"""
+        self._move_scheduled = False
+        new_pos, self._pending_pos = self._pending_pos, None
+        # Skip the move (and the WM_MOVE/repaint it triggers) when the position is unchanged
+        if new_pos is None or new_pos == self.pos():
+            return
+        self.move(new_pos)
+        # Move log window with main window if it's visible
+        if self.log_window is not None and self.log_window.isVisible():
+            log_pos = QPoint(self.x() + self.width(), self.y())
+            if self.log_window.pos() != log_pos:
+                self.log_window.move(log_pos)
+
     def mouseReleaseEvent(self, event):
         self.dragging = False
         self.offset = None
@@ -373,6 +563,8 @@ class VoiceEmailUI(QMainWindow):
 
     def toggle_log_display(self):
         """Toggle the visibility of the log display"""
+        if self.log_window is None:
+            self._create_log_window()
         if self.log_window.isVisible():
             self.log_window.hide()
             self.toggle_log_button.setText("▶")
@@ -388,6 +580,17 @@ def main():
     
     loop = QEventLoop(app)
     asyncio.set_event_loop(loop)
+
+    # 未被处理的任务异常只在发生时记录一次，而不是周期性检查事件循环状态
+    def handle_loop_exception(loop, context):
+        exception = context.get("exception")
+        message = context.get("message", "Unhandled exception in event loop")
+        if exception is not None:
+            logger.opt(exception=exception).error(f"{message}: {type(exception).__name__}: {exception}")
+        else:
+            logger.error(message)
+
+    loop.set_exception_handler(handle_loop_exception)
     
     window = VoiceEmailUI()
     window.hide()  # 初始隐藏窗口
@@ -401,37 +604,57 @@ def main():
             logger.error(f"Initialization failed: {str(e)}")
             sys.exit(1)
     
-    # 注册全局热键
-    keyboard.add_hotkey('ctrl+alt+m', window.show_window)
-    
     # 退出处理
+    # 退出流程只执行一次：app.quit() 会再次触发 aboutToQuit
+    shutting_down = asyncio.Event()
+
     async def shutdown():
+        if shutting_down.is_set():
+            return
+        shutting_down.set()
         try:
             logger.info("Starting application shutdown...")
+            hotkeys.stop()
             if window.recording:
                 await window.stop_recording()
-            await window.workflow.cleanup()
-            await window.cleanup()
+            await window.cancel_background_tasks()
+            await window.workflow.full_cleanup()
             app.quit()
             logger.info("Application shutdown completed")
         except Exception as e:
             logger.error(f"Error during shutdown: {str(e)}")
             app.quit()
+
+    # 热键和 aboutToQuit 共用同一个退出任务，重复触发时不再创建新任务
+    shutdown_task = None
+
+    def trigger_shutdown():
+        nonlocal shutdown_task
+        if shutdown_task is None or shutdown_task.done():
+            shutdown_task = asyncio.ensure_future(shutdown())
     
-    # 注册退出热键
-    keyboard.add_hotkey('ctrl+alt+q', lambda: asyncio.create_task(shutdown()))
+    # 注册全局热键：Ctrl+Alt+M 显示窗口（转交到 Qt 主线程），Ctrl+Alt+Q 退出
+    hotkeys = HotkeyListener({
+        1: (MOD_CONTROL | MOD_ALT, ord('M'),
+            lambda: QMetaObject.invokeMethod(window, "show_window", Qt.ConnectionType.QueuedConnection)),
+        # 回调运行在热键线程，必须通过 call_soon_threadsafe 交给事件循环线程创建任务
+        2: (MOD_CONTROL | MOD_ALT, ord('Q'),
+            lambda: loop.call_soon_threadsafe(trigger_shutdown)),
+    })
+    hotkeys.start()
     
     # 运行初始化和事件循环
     try:
         with loop:
             loop.run_until_complete(init())
             # 设置应用程序退出时的清理
-            app.aboutToQuit.connect(lambda: asyncio.create_task(shutdown()))
+            app.aboutToQuit.connect(trigger_shutdown)
             loop.run_forever()
     except Exception as e:
         logger.error(f"Application error: {str(e)}")
         raise
     finally:
+        hotkeys.stop()
         loop.close()
 
 if __name__ == '__main__':